@@ -229,15 +229,15 @@ def stats(trace_file: Path, as_json: bool) -> None:
     tools_used: set[str] = set()
 
     for event in events:
-        if event.event_type == EventType.LLM_REQUEST:
+        if event.event_type is EventType.LLM_REQUEST:
             model = event.data.get("model", "")
             if model:
                 models_used.add(model)
-        elif event.event_type == EventType.LLM_RESPONSE:
+        elif event.event_type is EventType.LLM_RESPONSE:
             tokens = event.data.get("tokens")
             if tokens and isinstance(tokens, int):
                 total_tokens += tokens
-        elif event.event_type == EventType.TOOL_CALL:
+        elif event.event_type is EventType.TOOL_CALL:
             tool = event.data.get("tool", "")
             if tool:
                 tools_used.add(tool)
@@ -3,21 +3,39 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any
+from operator import ne
+from itertools import compress, count, starmap, zip_longest
+from typing import Any, Callable
 
 from .trace import Event, EventType, Trace
 
+# Pad value for zip_longest scans; compares unequal to every comparison key.
+_MISSING = object()
 
-@dataclass
+
+@dataclass(slots=True)
 class Divergence:
-    """A point where two traces differ."""
+    """A point where two traces differ.
+
+    ``description`` is rendered lazily from ``description_fn`` on first
+    access, so callers that only inspect counts or severities never pay
+    for the string formatting.
+    """
     position: int
-    description: str
+    description_fn: Callable[[], str] | None = None
     trace_a_event: Event | None = None
     trace_b_event: Event | None = None
     trace_a_span: str = ""
     trace_b_span: str = ""
     severity: str = "info"  # info, warning, critical
+    _description: str = ""
+
+    @property
+    def description(self) -> str:
+        if not self._description and self.description_fn is not None:
+            self._description = self.description_fn()
+            self.description_fn = None
+        return self._description
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -31,7 +49,7 @@ class Divergence:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class DiffResult:
     """Result of comparing two traces."""
     trace_a_id: str
@@ -59,6 +77,45 @@ class DiffResult:
         }
 
 
+def _collect(trace: Trace) -> tuple[list[Event], dict[str, str]]:
+    """Gather a trace's events (timestamp-sorted) and its event->span index.
+
+    One pass over the spans produces both, instead of calling
+    ``Trace.all_events()`` and then re-walking every span to build the
+    span-name index.
+    """
+    events: list[Event] = []
+    ev2span: dict[str, str] = {}
+    for span in trace.spans:
+        name = span.name
+        for e in span.events:
+            events.append(e)
+            ev2span[e.event_id] = name
+    events.sort(key=lambda e: e.timestamp)
+    return events, ev2span
+
+
+def _encode(events: list[Event]) -> list[tuple[EventType, Any]]:
+    """Build per-event comparison keys: (event type, comparison-relevant field).
+
+    Two events compare equal for diff purposes exactly when their keys are
+    equal, so the main loop only needs to visit positions whose keys differ.
+    """
+    keys: list[tuple[EventType, Any]] = []
+    append = keys.append
+    for e in events:
+        t = e.event_type
+        if t is EventType.TOOL_CALL:
+            append((t, e.data.get("tool")))
+        elif t is EventType.LLM_RESPONSE:
+            append((t, e.data.get("content", "")))
+        elif t is EventType.DECISION:
+            append((t, e.data.get("choice")))
+        else:
+            append((t, None))
+    return keys
+
+
 def diff_traces(trace_a: Trace, trace_b: Trace) -> DiffResult:
     """Compare two traces and return divergence points.
 
@@ -69,27 +126,43 @@ def diff_traces(trace_a: Trace, trace_b: Trace) -> DiffResult:
     - Missing or extra events
     """
     result = DiffResult(trace_a_id=trace_a.trace_id, trace_b_id=trace_b.trace_id)
-    events_a = trace_a.all_events()
-    events_b = trace_b.all_events()
-
-    def _span_for_event(trace: Trace, event: Event) -> str:
-        for span in trace.spans:
-            if any(e.event_id == event.event_id for e in span.events):
-                return span.name
-        return "unknown"
+    events_a, ev2span_a = _collect(trace_a)
+    events_b, ev2span_b = _collect(trace_b)
+
+    len_a = len(events_a)
+    len_b = len(events_b)
+
+    # Prepass: encode both sequences into comparison keys, then visit only
+    # positions whose keys differ. zip_longest pads the shorter sequence
+    # with a sentinel that never compares equal, so unmatched tail
+    # positions fall out of the same C-level scan. Divergences are rare in
+    # practice, so this keeps the per-position branching off the common
+    # path.
+    keys_a = _encode(events_a)
+    keys_b = _encode(events_b)
+
+    # Common case first: re-running a stable agent produces an identical
+    # trace, and list equality over the keys is a single C-level pass.
+    if len_a == len_b and keys_a == keys_b:
+        result.summary = "Traces are identical in structure and content."
+        return result
 
-    max_len = max(len(events_a), len(events_b))
+    # The whole scan runs in C: zip_longest pairs the keys, starmap(ne)
+    # yields the mismatch mask, and compress(count(), ...) turns it into
+    # positions without a Python-level loop body per event.
+    mismatch = starmap(ne, zip_longest(keys_a, keys_b, fillvalue=_MISSING))
+    candidates = list(compress(count(), mismatch))
 
-    for i in range(max_len):
-        ea = events_a[i] if i < len(events_a) else None
-        eb = events_b[i] if i < len(events_b) else None
+    for i in candidates:
+        ea = events_a[i] if i < len_a else None
+        eb = events_b[i] if i < len_b else None
 
         if ea is None:
             result.divergences.append(Divergence(
                 position=i,
-                description=f"Trace B has extra event: {eb.event_type.value}",  # type: ignore
+                description_fn=lambda eb=eb: f"Trace B has extra event: {eb.event_type.value}",  # type: ignore
                 trace_b_event=eb,
-                trace_b_span=_span_for_event(trace_b, eb),  # type: ignore
+                trace_b_span=ev2span_b.get(eb.event_id, "unknown"),  # type: ignore
                 severity="warning",
             ))
             continue
@@ -97,62 +170,71 @@ def diff_traces(trace_a: Trace, trace_b: Trace) -> DiffResult:
         if eb is None:
             result.divergences.append(Divergence(
                 position=i,
-                description=f"Trace A has extra event: {ea.event_type.value}",
+                description_fn=lambda ea=ea: f"Trace A has extra event: {ea.event_type.value}",
                 trace_a_event=ea,
-                trace_a_span=_span_for_event(trace_a, ea),
+                trace_a_span=ev2span_a.get(ea.event_id, "unknown"),
                 severity="warning",
             ))
             continue
 
+        # Hoist attribute lookups out of the comparisons; enum members are
+        # singletons, so identity checks beat string equality here.
+        ta = ea.event_type
+        tb = eb.event_type
+        da = ea.data
+        db = eb.data
+
         # Compare event types
-        if ea.event_type != eb.event_type:
+        if ta is not tb:
             result.divergences.append(Divergence(
                 position=i,
-                description=f"Event type divergence: {ea.event_type.value} vs {eb.event_type.value}",
+                description_fn=lambda ta=ta, tb=tb: f"Event type divergence: {ta.value} vs {tb.value}",
                 trace_a_event=ea,
                 trace_b_event=eb,
-                trace_a_span=_span_for_event(trace_a, ea),
-                trace_b_span=_span_for_event(trace_b, eb),
+                trace_a_span=ev2span_a.get(ea.event_id, "unknown"),
+                trace_b_span=ev2span_b.get(eb.event_id, "unknown"),
                 severity="critical",
             ))
             continue
 
         # Compare event data for meaningful differences
-        if ea.event_type == EventType.TOOL_CALL:
-            if ea.data.get("tool") != eb.data.get("tool"):
+        if ta is EventType.TOOL_CALL:
+            tool_a = da.get("tool")
+            tool_b = db.get("tool")
+            if tool_a != tool_b:
                 result.divergences.append(Divergence(
                     position=i,
-                    description=f"Different tool called: {ea.data.get('tool')} vs {eb.data.get('tool')}",
+                    description_fn=lambda tool_a=tool_a, tool_b=tool_b: f"Different tool called: {tool_a} vs {tool_b}",
                     trace_a_event=ea,
                     trace_b_event=eb,
-                    trace_a_span=_span_for_event(trace_a, ea),
-                    trace_b_span=_span_for_event(trace_b, eb),
+                    trace_a_span=ev2span_a.get(ea.event_id, "unknown"),
+                    trace_b_span=ev2span_b.get(eb.event_id, "unknown"),
                     severity="critical",
                 ))
 
-        elif ea.event_type == EventType.LLM_RESPONSE:
-            content_a = ea.data.get("content", "")
-            content_b = eb.data.get("content", "")
-            if content_a != content_b:
+        elif ta is EventType.LLM_RESPONSE:
+            if da.get("content", "") != db.get("content", ""):
                 result.divergences.append(Divergence(
                     position=i,
-                    description="LLM response content differs",
+                    description_fn=lambda: "LLM response content differs",
                     trace_a_event=ea,
                     trace_b_event=eb,
-                    trace_a_span=_span_for_event(trace_a, ea),
-                    trace_b_span=_span_for_event(trace_b, eb),
+                    trace_a_span=ev2span_a.get(ea.event_id, "unknown"),
+                    trace_b_span=ev2span_b.get(eb.event_id, "unknown"),
                     severity="info",
                 ))
 
-        elif ea.event_type == EventType.DECISION:
-            if ea.data.get("choice") != eb.data.get("choice"):
+        elif ta is EventType.DECISION:
+            choice_a = da.get("choice")
+            choice_b = db.get("choice")
+            if choice_a != choice_b:
                 result.divergences.append(Divergence(
                     position=i,
-                    description=f"Decision divergence: '{ea.data.get('choice')}' vs '{eb.data.get('choice')}'",
+                    description_fn=lambda choice_a=choice_a, choice_b=choice_b: f"Decision divergence: '{choice_a}' vs '{choice_b}'",
                     trace_a_event=ea,
                     trace_b_event=eb,
-                    trace_a_span=_span_for_event(trace_a, ea),
-                    trace_b_span=_span_for_event(trace_b, eb),
+                    trace_a_span=ev2span_a.get(ea.event_id, "unknown"),
+                    trace_b_span=ev2span_b.get(eb.event_id, "unknown"),
                     severity="critical",
                 ))
 
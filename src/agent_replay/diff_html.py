@@ -55,20 +55,20 @@ footer { margin-top: 24px; font-size: 12px; color: #59636e; }
 def _event_summary(event: Event) -> str:
     """Return a compact plain-text summary of an event's data."""
     data = event.data
-    if event.event_type == EventType.LLM_REQUEST:
+    if event.event_type is EventType.LLM_REQUEST:
         return f"model={data.get('model', '')} messages={len(data.get('messages', []))}"
-    if event.event_type == EventType.LLM_RESPONSE:
+    if event.event_type is EventType.LLM_RESPONSE:
         content = str(data.get("content", ""))
         tokens = data.get("tokens")
         tok = f" ({tokens} tokens)" if tokens else ""
         return f'"{content}"{tok}'
-    if event.event_type == EventType.TOOL_CALL:
+    if event.event_type is EventType.TOOL_CALL:
         return f"{data.get('tool', '')}({data.get('args', {})})"
-    if event.event_type == EventType.TOOL_RESULT:
+    if event.event_type is EventType.TOOL_RESULT:
         return f"{data.get('tool', '')} -> {data.get('result', '')}"
-    if event.event_type == EventType.DECISION:
+    if event.event_type is EventType.DECISION:
         return f"{data.get('description', '')} -> {data.get('choice', '')}"
-    if event.event_type == EventType.ERROR:
+    if event.event_type is EventType.ERROR:
         return str(data.get("message", ""))
     return str(data.get("message", data))
 
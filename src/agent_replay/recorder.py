@@ -3,13 +3,22 @@
 from __future__ import annotations
 
 import functools
+import json
+import sys
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Callable, Generator
+from typing import Any, Callable, Generator, TextIO
 
 from .trace import EventType, Span, Trace
 
 
+def _canon(value: str) -> str:
+    """Intern short strings that repeat across events (model/tool names)."""
+    if value and len(value) <= 64:
+        return sys.intern(value)
+    return value
+
+
 class Recorder:
     """Records agent execution into a Trace.
 
@@ -25,6 +34,11 @@ class Recorder:
 
         trace = rec.trace
         trace.save("trace.jsonl")
+
+    With ``stream=True`` (requires ``output_path``), each span is appended
+    to the output file as soon as it closes instead of being written in
+    one pass at the end, so a crash mid-run loses at most the open spans.
+    The file stays loadable by :meth:`Trace.load`.
     """
 
     def __init__(
@@ -32,11 +46,20 @@ class Recorder:
         name: str = "agent-run",
         metadata: dict[str, Any] | None = None,
         output_path: str | Path | None = None,
+        stream: bool = False,
+        interested_types: set[EventType] | None = None,
     ) -> None:
-        self.trace = Trace(name=name, metadata=metadata or {})
+        self.trace = Trace(name=name, metadata=metadata or {}, interested=interested_types)
         self.output_path = Path(output_path) if output_path else None
+        self.stream = stream and self.output_path is not None
+        self._stream_file: TextIO | None = (
+            open(self.output_path, "w") if self.stream else None  # type: ignore[arg-type]
+        )
+        self._written_span_ids: set[str] = set()
+        # The current span is always the stack top; keeping a separate
+        # _current_span pointer meant an extra attribute write and branch
+        # on every span enter/exit.
         self._span_stack: list[Span] = []
-        self._current_span: Span | None = None
 
     def __enter__(self) -> Recorder:
         return self
@@ -47,59 +70,91 @@ class Recorder:
     def finish(self) -> Trace:
         """Finalize the trace, closing open spans and optionally saving."""
         self.trace.close()
-        if self.output_path:
+        if self._stream_file is not None:
+            for span in self.trace.spans:
+                self._stream_span(span)
+            header = {
+                "type": "trace_header",
+                "trace_id": self.trace.trace_id,
+                "name": self.trace.name,
+                "start_time": self.trace.start_time,
+                "end_time": self.trace.end_time,
+                "metadata": self.trace.metadata,
+            }
+            self._stream_file.write(json.dumps(header) + "\n")
+            self._stream_file.close()
+            self._stream_file = None
+        elif self.output_path:
             self.trace.save(self.output_path)
         return self.trace
 
+    def _stream_span(self, span: Span) -> None:
+        """Append one closed span to the output file (stream mode only)."""
+        if self._stream_file is None or span.span_id in self._written_span_ids:
+            return
+        self._written_span_ids.add(span.span_id)
+        self._stream_file.write(json.dumps({"type": "span", **span.to_dict()}) + "\n")
+        self._stream_file.flush()
+
     @contextmanager
     def span(self, name: str, metadata: dict[str, Any] | None = None) -> Generator[Span, None, None]:
         """Open a named span (context manager). Spans can nest."""
-        parent_id = self._current_span.span_id if self._current_span else None
+        stack = self._span_stack
+        parent_id = stack[-1].span_id if stack else None
         s = self.trace.add_span(name, parent_id=parent_id, metadata=metadata or {})
-        self._span_stack.append(s)
-        prev = self._current_span
-        self._current_span = s
+        stack.append(s)
         try:
             yield s
         finally:
             s.close()
-            self._span_stack.pop()
-            self._current_span = prev
+            stack.pop()
+            self._stream_span(s)
 
     def _ensure_span(self) -> Span:
-        if self._current_span is None:
-            s = self.trace.add_span("default")
-            self._span_stack.append(s)
-            self._current_span = s
-        return self._current_span
+        if not self._span_stack:
+            self._span_stack.append(self.trace.add_span("default"))
+        return self._span_stack[-1]
 
     def event(self, event_type: EventType, data: dict[str, Any] | None = None) -> None:
         """Record a raw event in the current span."""
-        self._ensure_span().add_event(event_type, data)
+        stack = self._span_stack
+        span = stack[-1] if stack else self._ensure_span()
+        span.add_event(event_type, data)
+
+    @staticmethod
+    def _merged(data: dict[str, Any], kwargs: dict[str, Any]) -> dict[str, Any]:
+        """Fold extra kwargs into the event payload without a second dict.
+
+        The ``{**base, **kwargs}`` splat used previously allocated a fresh
+        dict per event even when kwargs was empty (the common case).
+        """
+        if kwargs:
+            data.update(kwargs)
+        return data
 
     def llm_request(self, model: str = "", messages: list[Any] | None = None, **kwargs: Any) -> None:
-        self.event(EventType.LLM_REQUEST, {"model": model, "messages": messages or [], **kwargs})
+        self.event(EventType.LLM_REQUEST, self._merged({"model": _canon(model), "messages": messages or []}, kwargs))
 
     def llm_response(self, content: str = "", tokens: int | None = None, **kwargs: Any) -> None:
-        self.event(EventType.LLM_RESPONSE, {"content": content, "tokens": tokens, **kwargs})
+        self.event(EventType.LLM_RESPONSE, self._merged({"content": content, "tokens": tokens}, kwargs))
 
     def tool_call(self, tool: str, args: dict[str, Any] | None = None, **kwargs: Any) -> None:
-        self.event(EventType.TOOL_CALL, {"tool": tool, "args": args or {}, **kwargs})
+        self.event(EventType.TOOL_CALL, self._merged({"tool": _canon(tool), "args": args or {}}, kwargs))
 
     def tool_result(self, tool: str, result: Any = None, **kwargs: Any) -> None:
-        self.event(EventType.TOOL_RESULT, {"tool": tool, "result": result, **kwargs})
+        self.event(EventType.TOOL_RESULT, self._merged({"tool": _canon(tool), "result": result}, kwargs))
 
     def decision(self, description: str, choice: str = "", **kwargs: Any) -> None:
-        self.event(EventType.DECISION, {"description": description, "choice": choice, **kwargs})
+        self.event(EventType.DECISION, self._merged({"description": description, "choice": choice}, kwargs))
 
     def state_change(self, key: str, old: Any = None, new: Any = None, **kwargs: Any) -> None:
-        self.event(EventType.STATE_CHANGE, {"key": key, "old": old, "new": new, **kwargs})
+        self.event(EventType.STATE_CHANGE, self._merged({"key": key, "old": old, "new": new}, kwargs))
 
     def log(self, message: str, level: str = "info", **kwargs: Any) -> None:
-        self.event(EventType.LOG, {"message": message, "level": level, **kwargs})
+        self.event(EventType.LOG, self._merged({"message": message, "level": _canon(level)}, kwargs))
 
     def error(self, message: str, exception: str | None = None, **kwargs: Any) -> None:
-        self.event(EventType.ERROR, {"message": message, "exception": exception, **kwargs})
+        self.event(EventType.ERROR, self._merged({"message": message, "exception": exception}, kwargs))
 
 
 def record_trace(
@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+import heapq
+from array import array
+from itertools import islice
+from operator import gt
 from dataclasses import dataclass
 from pathlib import Path
 
 from .trace import Event, Span, Trace
 
 
-@dataclass
+@dataclass(slots=True)
 class ReplayState:
     """Current position in a trace replay."""
     span_index: int = 0
@@ -47,17 +51,47 @@ class ReplayEngine:
     def __init__(self, trace: Trace) -> None:
         self.trace = trace
         self._flat: list[tuple[Span, Event]] = []
+        # Struct-of-arrays companions to _flat: scanning a flat list of
+        # span ids or timestamps avoids a tuple unpack plus attribute
+        # chain per element in the hot loops below.
+        self._span_ids: list[str] = []
+        self._timestamps: array[float] = array("d")
+        self._search_index: list[str] = []
+        # Token -> positions inverted index, built lazily on first search.
+        self._token_positions: dict[str, list[int]] | None = None
         self._position: int = 0
         self._build_flat_list()
 
     def _build_flat_list(self) -> None:
-        """Flatten all spans/events into a sequential list sorted by timestamp."""
-        pairs: list[tuple[Span, Event]] = []
+        """Flatten all spans/events into a sequential list sorted by timestamp.
+
+        Events within a span are almost always already in timestamp order
+        (the recorder appends them as they happen), so a k-way merge over
+        the per-span lists is O(N log S) instead of O(N log N) for a full
+        sort, where S is the span count.
+        """
+        per_span: list[list[tuple[Span, Event]]] = []
+        key = lambda p: p[1].timestamp  # noqa: E731
         for span in self.trace.spans:
-            for event in span.events:
-                pairs.append((span, event))
-        pairs.sort(key=lambda p: p[1].timestamp)
-        self._flat = pairs
+            pairs = [(span, event) for event in span.events]
+            # heapq.merge needs sorted inputs; only pay for a sort when a
+            # span's events are actually out of order. The check runs on
+            # the extracted timestamp column, in C.
+            ts = [event.timestamp for event in span.events]
+            if any(map(gt, ts, islice(ts, 1, None))):
+                pairs.sort(key=key)
+            per_span.append(pairs)
+        if len(per_span) == 1:
+            self._flat = per_span[0]
+        else:
+            self._flat = list(heapq.merge(*per_span, key=key))
+        self._span_ids = [s.span_id for s, _ in self._flat]
+        self._timestamps = array("d", (e.timestamp for _, e in self._flat))
+        # Pre-lowered searchable text per step, so search() is a plain
+        # substring scan with no string building per query.
+        self._search_index = [
+            f"{s.name} {e.event_type.value} {e.data}".lower() for s, e in self._flat
+        ]
 
     @classmethod
     def from_file(cls, path: str | Path) -> ReplayEngine:
@@ -113,8 +147,9 @@ class ReplayEngine:
         """Get all events in the current span."""
         if not self._flat or self._position >= len(self._flat):
             return []
-        current_span = self._flat[min(self._position, len(self._flat) - 1)][0]
-        return [(s, e) for s, e in self._flat if s.span_id == current_span.span_id]
+        current_id = self._span_ids[min(self._position, len(self._flat) - 1)]
+        flat = self._flat
+        return [flat[i] for i, sid in enumerate(self._span_ids) if sid == current_id]
 
     def playback_plan(
         self,
@@ -144,30 +179,48 @@ class ReplayEngine:
         if not self._flat:
             return steps
 
-        first_ts = self._flat[0][1].timestamp
+        timestamps = self._timestamps
+        first_ts = timestamps[0]
         prev_ts = first_ts
-        for span, event in self._flat:
-            gap = max(0.0, event.timestamp - prev_ts)
+        for i, (span, event) in enumerate(self._flat):
+            ts = timestamps[i]
+            gap = max(0.0, ts - prev_ts)
             delay = gap / speed
             if max_delay is not None:
                 delay = min(delay, max_delay)
             steps.append(
                 PlaybackStep(
                     delay=delay,
-                    elapsed=max(0.0, event.timestamp - first_ts),
+                    elapsed=max(0.0, ts - first_ts),
                     span=span,
                     event=event,
                 )
             )
-            prev_ts = event.timestamp
+            prev_ts = ts
         return steps
 
     def search(self, query: str) -> list[int]:
-        """Find positions where event data contains the query string."""
-        results: list[int] = []
+        """Find positions where event data contains the query string.
+
+        Whitespace-free queries run against a lazily built inverted index
+        (token -> positions), so repeated searches only scan the distinct
+        tokens instead of every row. A whitespace-free match always lies
+        within a single whitespace-delimited token, so results are
+        identical to the substring scan, which remains the fallback for
+        queries that contain whitespace.
+        """
         query_lower = query.lower()
-        for i, (span, event) in enumerate(self._flat):
-            searchable = f"{span.name} {event.event_type.value} {event.data}"
-            if query_lower in searchable.lower():
-                results.append(i)
-        return results
+        if not query_lower or any(c.isspace() for c in query_lower):
+            return [i for i, row in enumerate(self._search_index) if query_lower in row]
+        index = self._token_positions
+        if index is None:
+            index = {}
+            for i, row in enumerate(self._search_index):
+                for token in set(row.split()):
+                    index.setdefault(token, []).append(i)
+            self._token_positions = index
+        hits: set[int] = set()
+        for token, positions in index.items():
+            if query_lower in token:
+                hits.update(positions)
+        return sorted(hits)
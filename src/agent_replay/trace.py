@@ -2,13 +2,29 @@
 
 from __future__ import annotations
 
+import concurrent.futures
+import heapq
 import json
+import mmap
+import os
+import sys
 import time
-import uuid
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from enum import Enum
+from itertools import islice
+from operator import gt
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised where orjson is absent
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - exercised where msgpack is absent
+    msgpack = None  # type: ignore[assignment]
 
 
 class EventType(str, Enum):
@@ -23,39 +39,169 @@ class EventType(str, Enum):
     LOG = "log"
 
 
-@dataclass
+# Value -> member table: a plain dict hit is much cheaper than Enum's
+# __call__ lookup, which matters when loading million-event traces.
+_EVENT_TYPE_BY_VALUE = {t.value: t for t in EventType}
+
+
+# Anchor the wall clock once and advance it with the monotonic clock:
+# timestamps stay epoch-seconds floats on the wire, but per-event reads
+# cannot jump backwards under clock adjustment, which the sort-merge
+# paths rely on.
+_EPOCH_ANCHOR = time.time() - time.monotonic()
+
+
+def _now() -> float:
+    return _EPOCH_ANCHOR + time.monotonic()
+
+
+def _iter_jsonl_lines(path: Path) -> Iterator[tuple[int, bytes]]:
+    """Yield (line_number, stripped line) for the non-empty lines of a file.
+
+    Memory-maps the file and reads lines straight from the mapping, so
+    only one line's bytes are materialized at a time and no text-mode
+    decoding happens. Zero-length files (which cannot be mapped) yield
+    nothing.
+    """
+    with open(path, "rb") as f:
+        try:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return
+        with buf:
+            for line_num, line in enumerate(iter(buf.readline, b""), 1):
+                line = line.strip()
+                if line:
+                    yield line_num, line
+
+
+# Below this many JSONL lines, process startup outweighs parallel parsing.
+_PARALLEL_LOAD_MIN_LINES = 10_000
+
+
+def _parse_lines(
+    job: tuple[int, list[bytes]],
+) -> tuple[dict[str, Any] | None, list[dict[str, Any]], list[int]]:
+    """Parse one chunk of JSONL lines (worker for Trace.load_parallel).
+
+    Returns the header record if this chunk contained it, the parsed span
+    dicts in order, and the line numbers of malformed lines.
+    """
+    start_line, lines = job
+    loads = json.loads if orjson is None else orjson.loads
+    header: dict[str, Any] | None = None
+    span_dicts: list[dict[str, Any]] = []
+    bad_lines: list[int] = []
+    for offset, line in enumerate(lines):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = loads(line)
+        except ValueError:
+            bad_lines.append(start_line + offset)
+            continue
+        if record.get("type") == "trace_header":
+            header = record
+        elif record.get("type") == "span":
+            record.pop("type", None)
+            span_dicts.append(record)
+    return header, span_dicts, bad_lines
+
+
+def _intern_short(value: Any) -> Any:
+    """Intern short strings parsed from JSON; pass everything else through.
+
+    Loaded traces repeat the same small vocabulary of values endlessly
+    (model names, tool names, log levels, span names); interning
+    collapses each repeated value to one shared object. The length cap
+    keeps large payload strings (message content, tool output) out of
+    the intern table, and the exact-type check is required because
+    ``sys.intern`` rejects str subclasses.
+    """
+    if type(value) is str and 0 < len(value) <= 64:
+        return sys.intern(value)
+    return value
+
+
+def _sid() -> str:
+    """12-hex-char random id for spans/events.
+
+    Same 48 bits of entropy as the uuid4-hex slice it replaces, without
+    constructing a UUID object per id.
+    """
+    return os.urandom(6).hex()
+
+
+def _tid() -> str:
+    """16-hex-char random id for traces (64 bits)."""
+    return os.urandom(8).hex()
+
+
+@dataclass(slots=True, frozen=True)
 class Event:
-    """A single event within a span."""
+    """A single event within a span.
+
+    Frozen: events are immutable once recorded (redaction builds new
+    Event instances rather than editing in place).
+    """
     event_type: EventType
-    timestamp: float = field(default_factory=time.time)
-    data: dict[str, Any] = field(default_factory=dict)
-    event_id: str = field(default_factory=lambda: uuid.uuid4().hex[:12])
+    timestamp: float = field(default_factory=_now)
+    # None (not default_factory=dict) so the overwhelmingly common case of
+    # a caller-supplied payload does not allocate a dict just to drop it.
+    data: dict[str, Any] = None  # type: ignore[assignment]
+    event_id: str = field(default_factory=_sid)
+
+    def __post_init__(self) -> None:
+        if self.data is None:
+            object.__setattr__(self, "data", {})
 
     def to_dict(self) -> dict[str, Any]:
-        d = asdict(self)
-        d["event_type"] = self.event_type.value
-        return d
+        # asdict() deep-copies every field (including arbitrarily large
+        # data payloads); a literal dict just references them. EventType
+        # mixes in str, so the member itself serializes as its value and
+        # the .value descriptor call per event can be skipped.
+        return {
+            "event_type": self.event_type,
+            "timestamp": self.timestamp,
+            "data": self.data,
+            "event_id": self.event_id,
+        }
 
     @classmethod
     def from_dict(cls, d: dict[str, Any]) -> Event:
+        data = d.get("data", {})
+        if data:
+            # json.loads returns fresh key strings per line; interning the
+            # keys makes every loaded event share one object per key name,
+            # so data.get("tool")-style lookups in hot paths hit the
+            # pointer-equality fast path. Short values get the same
+            # treatment: tool/model names and log levels repeat across
+            # events, and one shared object per distinct value beats a
+            # fresh copy per event.
+            data = {sys.intern(k): _intern_short(v) for k, v in data.items()}
+        raw_type = d["event_type"]
         return cls(
-            event_type=EventType(d["event_type"]),
+            event_type=_EVENT_TYPE_BY_VALUE.get(raw_type) or EventType(raw_type),
             timestamp=d["timestamp"],
-            data=d.get("data", {}),
-            event_id=d.get("event_id", uuid.uuid4().hex[:12]),
+            data=data,
+            event_id=d.get("event_id") or _sid(),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Span:
     """A named execution span containing events. Spans can nest."""
     name: str
-    span_id: str = field(default_factory=lambda: uuid.uuid4().hex[:12])
+    span_id: str = field(default_factory=_sid)
     parent_id: str | None = None
-    start_time: float = field(default_factory=time.time)
+    start_time: float = field(default_factory=_now)
     end_time: float | None = None
     events: list[Event] = field(default_factory=list)
     metadata: dict[str, Any] = field(default_factory=dict)
+    # Optional record-time filter: event types not in this set are dropped
+    # before allocation. Not serialized.
+    interested: set[EventType] | None = field(default=None, repr=False, compare=False)
 
     @property
     def duration(self) -> float | None:
@@ -63,13 +209,48 @@ class Span:
             return None
         return self.end_time - self.start_time
 
-    def add_event(self, event_type: EventType, data: dict[str, Any] | None = None) -> Event:
-        event = Event(event_type=event_type, data=data or {})
+    def add_event(self, event_type: EventType, data: dict[str, Any] | None = None) -> Event | None:
+        if self.interested is not None and event_type not in self.interested:
+            return None
+        # Hot path: skip the generated dataclass __init__ (keyword
+        # handling, defaults, __post_init__) and write the four slots
+        # directly. Event is frozen, hence object.__setattr__.
+        event = Event.__new__(Event)
+        set_ = object.__setattr__
+        set_(event, "event_type", event_type)
+        set_(event, "timestamp", _now())
+        set_(event, "data", data if data is not None else {})
+        set_(event, "event_id", _sid())
         self.events.append(event)
         return event
 
+    def add_events(self, items: Iterable[tuple[EventType, dict[str, Any] | None]]) -> list[Event]:
+        """Append a batch of (event_type, data) pairs in one pass.
+
+        Cheaper than calling :meth:`add_event` per item for bursts
+        (streaming tokens, multi-part tool results): the batch is built
+        locally and appended with a single extend, amortizing list
+        growth. Returns the events actually recorded (the ``interested``
+        filter applies per item).
+        """
+        interested = self.interested
+        set_ = object.__setattr__
+        batch: list[Event] = []
+        append = batch.append
+        for event_type, data in items:
+            if interested is not None and event_type not in interested:
+                continue
+            event = Event.__new__(Event)
+            set_(event, "event_type", event_type)
+            set_(event, "timestamp", _now())
+            set_(event, "data", data if data is not None else {})
+            set_(event, "event_id", _sid())
+            append(event)
+        self.events.extend(batch)
+        return batch
+
     def close(self) -> None:
-        self.end_time = time.time()
+        self.end_time = _now()
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -85,7 +266,7 @@ class Span:
     @classmethod
     def from_dict(cls, d: dict[str, Any]) -> Span:
         return cls(
-            name=d["name"],
+            name=_intern_short(d["name"]),
             span_id=d["span_id"],
             parent_id=d.get("parent_id"),
             start_time=d["start_time"],
@@ -95,15 +276,21 @@ class Span:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Trace:
     """A complete execution trace consisting of ordered spans."""
-    trace_id: str = field(default_factory=lambda: uuid.uuid4().hex[:16])
+    trace_id: str = field(default_factory=_tid)
     name: str = "unnamed"
-    start_time: float = field(default_factory=time.time)
+    start_time: float = field(default_factory=_now)
     end_time: float | None = None
     spans: list[Span] = field(default_factory=list)
     metadata: dict[str, Any] = field(default_factory=dict)
+    # Record-time event filter inherited by every span this trace opens;
+    # None records everything. Not serialized.
+    interested: set[EventType] | None = field(default=None, repr=False, compare=False)
+    # span_id -> Span lookup table; kept in step with add_span and
+    # rebuilt lazily if spans was mutated directly.
+    _span_index: dict[str, Span] = field(default_factory=dict, repr=False, compare=False)
 
     @property
     def duration(self) -> float | None:
@@ -116,28 +303,45 @@ class Trace:
         return sum(len(s.events) for s in self.spans)
 
     def add_span(self, name: str, parent_id: str | None = None, **kwargs: Any) -> Span:
+        kwargs.setdefault("interested", self.interested)
         span = Span(name=name, parent_id=parent_id, **kwargs)
         self.spans.append(span)
+        self._span_index[span.span_id] = span
         return span
 
     def close(self) -> None:
-        self.end_time = time.time()
+        self.end_time = _now()
         for span in self.spans:
             if span.end_time is None:
                 span.close()
 
     def get_span(self, span_id: str) -> Span | None:
-        for span in self.spans:
-            if span.span_id == span_id:
-                return span
-        return None
+        if len(self._span_index) != len(self.spans):
+            self._span_index = {s.span_id: s for s in self.spans}
+        return self._span_index.get(span_id)
 
     def all_events(self) -> list[Event]:
-        """Return all events across spans, sorted by timestamp."""
-        events = []
+        """Return all events across spans, sorted by timestamp.
+
+        Events within a span are recorded in timestamp order, so a k-way
+        merge over the per-span lists is O(E log S) instead of O(E log E)
+        for a full sort; a span whose events are out of order is sorted
+        first so the result always matches a global sort.
+        """
+        key = lambda e: e.timestamp  # noqa: E731
+        per_span: list[list[Event]] = []
         for span in self.spans:
-            events.extend(span.events)
-        return sorted(events, key=lambda e: e.timestamp)
+            events = span.events
+            # Pull the timestamp column out once; map(gt, ts, ts[1:])
+            # runs the order check in C instead of dereferencing two
+            # Event objects per step.
+            ts = [e.timestamp for e in events]
+            if any(map(gt, ts, islice(ts, 1, None))):
+                events = sorted(events, key=key)
+            per_span.append(events)
+        if len(per_span) == 1:
+            return list(per_span[0])
+        return list(heapq.merge(*per_span, key=key))
 
     def filter_events(self, *event_types: EventType) -> list[Event]:
         """Return events matching any of the given types, sorted by timestamp.
@@ -194,56 +398,188 @@ class Trace:
         )
 
     def save(self, path: str | Path) -> Path:
-        """Save trace as JSONL (one line per span, header first)."""
+        """Save trace as JSONL (one line per span, header first).
+
+        Serializes with orjson when installed (several times faster,
+        writes bytes directly); otherwise stdlib json. The file format is
+        identical either way.
+        """
         path = Path(path)
-        with open(path, "w") as f:
-            header = {
-                "type": "trace_header",
-                "trace_id": self.trace_id,
-                "name": self.name,
-                "start_time": self.start_time,
-                "end_time": self.end_time,
-                "metadata": self.metadata,
-            }
-            f.write(json.dumps(header) + "\n")
+        header = {
+            "type": "trace_header",
+            "trace_id": self.trace_id,
+            "name": self.name,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "metadata": self.metadata,
+        }
+        if orjson is not None:
+            # A 1 MiB buffer keeps many-span traces from paying a write
+            # syscall every couple of records.
+            with open(path, "wb", buffering=1 << 20) as fb:
+                fb.write(orjson.dumps(header, option=orjson.OPT_NON_STR_KEYS))
+                fb.write(b"\n")
+                for span in self.spans:
+                    record = {"type": "span", **span.to_dict()}
+                    fb.write(orjson.dumps(record, option=orjson.OPT_NON_STR_KEYS))
+                    fb.write(b"\n")
+            return path
+        with open(path, "w", buffering=1 << 20) as f:
+            f.write(json.dumps(header))
+            f.write("\n")
             for span in self.spans:
                 record = {"type": "span", **span.to_dict()}
-                f.write(json.dumps(record) + "\n")
+                f.write(json.dumps(record))
+                f.write("\n")
+        return path
+
+    def save_msgpack(self, path: str | Path) -> Path:
+        """Save trace as a single MessagePack document.
+
+        A binary alternative to :meth:`save`: typically smaller on disk
+        and faster to parse than JSONL, at the cost of not being
+        greppable or streamable line by line. Requires the optional
+        ``msgpack`` dependency (``pip install agent-trace-replay[perf]``).
+        """
+        if msgpack is None:
+            raise ImportError(
+                "msgpack is required for save_msgpack; "
+                "install it with `pip install agent-trace-replay[perf]`"
+            )
+        path = Path(path)
+        path.write_bytes(msgpack.packb(self.to_dict(), use_bin_type=True))
         return path
 
+    @classmethod
+    def load_msgpack(cls, path: str | Path) -> Trace:
+        """Load a trace written by :meth:`save_msgpack`."""
+        if msgpack is None:
+            raise ImportError(
+                "msgpack is required for load_msgpack; "
+                "install it with `pip install agent-trace-replay[perf]`"
+            )
+        return cls.from_dict(msgpack.unpackb(Path(path).read_bytes(), raw=False))
+
     @classmethod
     def load(cls, path: str | Path) -> Trace:
         """Load trace from a JSONL file.
 
-        Malformed lines are skipped with a warning printed to stderr.
+        The file is memory-mapped and parsed line by line, so the raw
+        bytes are never copied wholesale into Python and there is no
+        per-line text decoding. Malformed lines are skipped with a
+        warning printed to stderr.
         """
         path = Path(path)
         spans: list[Span] = []
         header: dict[str, Any] = {}
-        with open(path) as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    record = json.loads(line)
-                except json.JSONDecodeError:
-                    import sys
-                    print(
-                        f"Warning: skipping malformed JSON on line {line_num} in {path}",
-                        file=sys.stderr,
-                    )
-                    continue
-                if record.get("type") == "trace_header":
-                    header = record
-                elif record.get("type") == "span":
-                    record.pop("type", None)
-                    spans.append(Span.from_dict(record))
+        loads = json.loads if orjson is None else orjson.loads
+        for line_num, line in _iter_jsonl_lines(path):
+            try:
+                record = loads(line)
+            except ValueError:
+                print(
+                    f"Warning: skipping malformed JSON on line {line_num} in {path}",
+                    file=sys.stderr,
+                )
+                continue
+            if record.get("type") == "trace_header":
+                header = record
+            elif record.get("type") == "span":
+                record.pop("type", None)
+                spans.append(Span.from_dict(record))
+        return cls._from_header(header, spans)
+
+    @staticmethod
+    def iter_spans(path: str | Path) -> Iterator[Span]:
+        """Yield spans from a JSONL trace file one at a time.
+
+        Unlike :meth:`load`, which materializes the whole trace, this
+        parses each span line lazily and never holds more than one span
+        in memory, so arbitrarily large files can be scanned in constant
+        space. Malformed lines are skipped with the same stderr warning
+        as :meth:`load`; the header line is ignored (use
+        :meth:`load_header` for it).
+        """
+        path = Path(path)
+        loads = json.loads if orjson is None else orjson.loads
+        for line_num, line in _iter_jsonl_lines(path):
+            try:
+                record = loads(line)
+            except ValueError:
+                print(
+                    f"Warning: skipping malformed JSON on line {line_num} in {path}",
+                    file=sys.stderr,
+                )
+                continue
+            if record.get("type") == "span":
+                record.pop("type", None)
+                yield Span.from_dict(record)
+
+    @staticmethod
+    def load_header(path: str | Path) -> dict[str, Any]:
+        """Return the trace header record from a JSONL file.
+
+        Stops at the first header line, so for files written by
+        :meth:`save` (header first) only one line is read regardless of
+        trace size. Returns an empty dict if no header is present.
+        """
+        path = Path(path)
+        loads = json.loads if orjson is None else orjson.loads
+        for _line_num, line in _iter_jsonl_lines(path):
+            try:
+                record = loads(line)
+            except ValueError:
+                continue
+            if record.get("type") == "trace_header":
+                return record
+        return {}
+
+    @classmethod
+    def _from_header(cls, header: dict[str, Any], spans: list[Span]) -> Trace:
+        """Assemble a Trace from a parsed header record and span list."""
         return cls(
-            trace_id=header.get("trace_id", uuid.uuid4().hex[:16]),
+            trace_id=header.get("trace_id") or _tid(),
             name=header.get("name", "unnamed"),
             start_time=header.get("start_time", 0),
             end_time=header.get("end_time"),
             spans=spans,
             metadata=header.get("metadata", {}),
         )
+
+    @classmethod
+    def load_parallel(cls, path: str | Path, workers: int | None = None) -> Trace:
+        """Load a JSONL trace, parsing line chunks across processes.
+
+        JSONL lines are independent, so parsing scales with cores; worth
+        it for traces tens of megabytes and up. Small files (and
+        single-worker calls) fall back to :meth:`load`. Workers return
+        plain dicts and the Span objects are built in the parent, so no
+        object graphs cross the process boundary. Malformed lines are
+        skipped with the same stderr warning as :meth:`load`.
+        """
+        path = Path(path)
+        workers = workers or os.cpu_count() or 1
+        lines = path.read_bytes().split(b"\n")
+        if workers <= 1 or len(lines) < _PARALLEL_LOAD_MIN_LINES:
+            return cls.load(path)
+
+        chunk_size = -(-len(lines) // workers)  # ceil division
+        jobs = [
+            (start + 1, lines[start : start + chunk_size])
+            for start in range(0, len(lines), chunk_size)
+        ]
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_parse_lines, jobs))
+
+        header: dict[str, Any] = {}
+        spans: list[Span] = []
+        for chunk_header, span_dicts, bad_lines in results:
+            if chunk_header is not None:
+                header = chunk_header
+            for line_num in bad_lines:
+                print(
+                    f"Warning: skipping malformed JSON on line {line_num} in {path}",
+                    file=sys.stderr,
+                )
+            spans.extend(Span.from_dict(d) for d in span_dicts)
+        return cls._from_header(header, spans)
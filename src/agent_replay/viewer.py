@@ -35,6 +35,17 @@ EVENT_ICONS: dict[EventType, str] = {
     EventType.LOG: "📋",
 }
 
+# Per-type render strings precomputed once: one dict hit per event when
+# drawing trees/labels instead of two lookups plus string interpolation.
+_TREE_FMT: dict[EventType, str] = {
+    t: f"{EVENT_ICONS[t]} [{EVENT_COLORS[t]}]{t.value}[/{EVENT_COLORS[t]}]" for t in EventType
+}
+
+_LABEL_FMT: dict[EventType, str] = {
+    t: f"{EVENT_ICONS[t]} [{EVENT_COLORS[t]}]{t.value.replace('_', ' ').upper()}[/{EVENT_COLORS[t]}]"
+    for t in EventType
+}
+
 
 class TraceViewer:
     """Rich terminal viewer for traces."""
@@ -59,47 +70,49 @@ class TraceViewer:
             self._show_span(span)
 
     def _show_span(self, span: Span, indent: int = 0) -> None:
+        # Accumulate the span's lines and print once: each console.print
+        # call pays for markup parsing, segment building, and a terminal
+        # write, so one call per span beats two per event. The rendered
+        # output is identical to printing line by line.
         prefix = "  " * indent
         duration = f" ({span.duration:.3f}s)" if span.duration is not None else ""
-        self.console.print(f"\n{prefix}[bold yellow]>>> {span.name}[/bold yellow]{duration}")
-
+        lines = [f"\n{prefix}[bold yellow]>>> {span.name}[/bold yellow]{duration}"]
         for event in span.events:
-            icon = EVENT_ICONS.get(event.event_type, "?")
-            color = EVENT_COLORS.get(event.event_type, "white")
-            label = event.event_type.value.replace("_", " ").upper()
-            self.console.print(f"{prefix}  {icon} [{color}]{label}[/{color}]", end="")
-
-            # Show key data inline
-            data = event.data
-            if event.event_type == EventType.LLM_REQUEST:
-                model = data.get("model", "")
-                n_msgs = len(data.get("messages", []))
-                self.console.print(f" [dim]model={model} messages={n_msgs}[/dim]")
-            elif event.event_type == EventType.LLM_RESPONSE:
-                content = data.get("content", "")
-                preview = content[:80] + "..." if len(content) > 80 else content
-                tokens = data.get("tokens")
-                tok_str = f" [dim]({tokens} tokens)[/dim]" if tokens else ""
-                self.console.print(f' "{preview}"{tok_str}')
-            elif event.event_type == EventType.TOOL_CALL:
-                tool = data.get("tool", "")
-                args = data.get("args", {})
-                self.console.print(f" [bold]{tool}[/bold]({args})")
-            elif event.event_type == EventType.TOOL_RESULT:
-                tool = data.get("tool", "")
-                result = str(data.get("result", ""))
-                preview = result[:60] + "..." if len(result) > 60 else result
-                self.console.print(f" [bold]{tool}[/bold] -> {preview}")
-            elif event.event_type == EventType.DECISION:
-                desc = data.get("description", "")
-                choice = data.get("choice", "")
-                self.console.print(f" {desc} -> [bold]{choice}[/bold]")
-            elif event.event_type == EventType.ERROR:
-                msg = data.get("message", "")
-                self.console.print(f" [red]{msg}[/red]")
-            else:
-                msg = data.get("message", str(data)[:80])
-                self.console.print(f" {msg}")
+            lines.append(f"{prefix}  {_LABEL_FMT[event.event_type]}{self._event_detail(event)}")
+        self.console.print("\n".join(lines))
+
+    @staticmethod
+    def _event_detail(event: Event) -> str:
+        """Return the inline key-data markup shown after an event's label."""
+        data = event.data
+        if event.event_type is EventType.LLM_REQUEST:
+            model = data.get("model", "")
+            n_msgs = len(data.get("messages", []))
+            return f" [dim]model={model} messages={n_msgs}[/dim]"
+        if event.event_type is EventType.LLM_RESPONSE:
+            content = data.get("content", "")
+            preview = content[:80] + "..." if len(content) > 80 else content
+            tokens = data.get("tokens")
+            tok_str = f" [dim]({tokens} tokens)[/dim]" if tokens else ""
+            return f' "{preview}"{tok_str}'
+        if event.event_type is EventType.TOOL_CALL:
+            tool = data.get("tool", "")
+            args = data.get("args", {})
+            return f" [bold]{tool}[/bold]({args})"
+        if event.event_type is EventType.TOOL_RESULT:
+            tool = data.get("tool", "")
+            result = str(data.get("result", ""))
+            preview = result[:60] + "..." if len(result) > 60 else result
+            return f" [bold]{tool}[/bold] -> {preview}"
+        if event.event_type is EventType.DECISION:
+            desc = data.get("description", "")
+            choice = data.get("choice", "")
+            return f" {desc} -> [bold]{choice}[/bold]"
+        if event.event_type is EventType.ERROR:
+            msg = data.get("message", "")
+            return f" [red]{msg}[/red]"
+        msg = data.get("message", str(data)[:80])
+        return f" {msg}"
 
     def show_tree(self, trace: Trace) -> None:
         """Show trace as a tree structure."""
@@ -113,9 +126,7 @@ class TraceViewer:
             span_nodes[span.span_id] = node
 
             for event in span.events:
-                icon = EVENT_ICONS.get(event.event_type, "?")
-                color = EVENT_COLORS.get(event.event_type, "white")
-                node.add(f"{icon} [{color}]{event.event_type.value}[/{color}]")
+                node.add(_TREE_FMT[event.event_type])
 
         self.console.print(tree)
 
@@ -153,25 +164,25 @@ class TraceViewer:
     def _event_summary(self, event: Event) -> str:
         """Return a compact one-line plain-text summary of an event's data."""
         data = event.data
-        if event.event_type == EventType.LLM_REQUEST:
+        if event.event_type is EventType.LLM_REQUEST:
             model = data.get("model", "")
             n_msgs = len(data.get("messages", []))
             return f"model={model} messages={n_msgs}"
-        if event.event_type == EventType.LLM_RESPONSE:
+        if event.event_type is EventType.LLM_RESPONSE:
             content = str(data.get("content", ""))
             preview = content[:80] + "..." if len(content) > 80 else content
             tokens = data.get("tokens")
             tok_str = f" ({tokens} tokens)" if tokens else ""
             return f'"{preview}"{tok_str}'
-        if event.event_type == EventType.TOOL_CALL:
+        if event.event_type is EventType.TOOL_CALL:
             return f"{data.get('tool', '')}({data.get('args', {})})"
-        if event.event_type == EventType.TOOL_RESULT:
+        if event.event_type is EventType.TOOL_RESULT:
             result = str(data.get("result", ""))
             preview = result[:60] + "..." if len(result) > 60 else result
             return f"{data.get('tool', '')} -> {preview}"
-        if event.event_type == EventType.DECISION:
+        if event.event_type is EventType.DECISION:
             return f"{data.get('description', '')} -> {data.get('choice', '')}"
-        if event.event_type == EventType.ERROR:
+        if event.event_type is EventType.ERROR:
             return str(data.get("message", ""))
         return str(data.get("message", str(data)[:80]))
 
@@ -31,6 +31,49 @@ class TestRecorderContextManager:
         assert trace.end_time is not None
 
 
+class TestRecorderFiltering:
+    def test_interested_types_drops_other_events(self):
+        with Recorder("filtered", interested_types={EventType.TOOL_CALL}) as rec:
+            with rec.span("main"):
+                rec.tool_call("search", {"q": "x"})
+                rec.log("ignored")
+                rec.llm_response(content="also ignored")
+        events = rec.trace.all_events()
+        assert len(events) == 1
+        assert events[0].event_type == EventType.TOOL_CALL
+
+    def test_no_filter_records_everything(self):
+        with Recorder("unfiltered") as rec:
+            with rec.span("main"):
+                rec.tool_call("search")
+                rec.log("kept")
+        assert rec.trace.event_count == 2
+
+
+class TestRecorderStreaming:
+    def test_stream_writes_spans_incrementally(self, tmp_path: Path):
+        out = tmp_path / "stream.jsonl"
+        rec = Recorder("stream-test", output_path=out, stream=True)
+        with rec.span("first"):
+            rec.log("a")
+        # The closed span is on disk before finish().
+        assert sum(1 for line in out.read_text().splitlines() if line) == 1
+        rec.finish()
+
+    def test_stream_file_loads_as_trace(self, tmp_path: Path):
+        from agent_replay.trace import Trace
+
+        out = tmp_path / "stream.jsonl"
+        with Recorder("stream-test", output_path=out, stream=True) as rec:
+            with rec.span("s1"):
+                rec.tool_call("search", {"q": "x"})
+            rec.log("outside")
+        loaded = Trace.load(out)
+        assert loaded.name == "stream-test"
+        assert loaded.event_count == 2
+        assert len(loaded.spans) == 2
+
+
 class TestRecorderEvents:
     def test_all_event_types(self):
         with Recorder("full-test") as rec:
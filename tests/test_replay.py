@@ -41,6 +41,20 @@ def test_replay_search():
     assert len(results) >= 1
 
 
+def test_replay_search_matches_linear_scan():
+    engine = ReplayEngine(_make_trace())
+    for query in ("search", "gpt", "hello", "missing"):
+        expected = [i for i, row in enumerate(engine._search_index) if query in row]
+        assert engine.search(query) == expected
+
+
+def test_replay_search_with_whitespace_query():
+    engine = ReplayEngine(_make_trace())
+    # Queries spanning token boundaries use the substring fallback.
+    results = engine.search("step-1 llm_request")
+    assert results == [0]
+
+
 def test_replay_jump():
     engine = ReplayEngine(_make_trace())
     result = engine.jump(2)
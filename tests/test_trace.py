@@ -28,6 +28,33 @@ def test_span_add_event():
     assert span.events[0].data["message"] == "hello"
 
 
+def test_span_add_events_batch():
+    span = Span(name="batch")
+    added = span.add_events(
+        [
+            (EventType.LOG, {"message": "one"}),
+            (EventType.TOOL_CALL, {"tool": "search"}),
+            (EventType.LOG, None),
+        ]
+    )
+    assert len(added) == 3
+    assert len(span.events) == 3
+    assert span.events[1].data["tool"] == "search"
+    assert span.events[2].data == {}
+
+
+def test_span_add_events_respects_interested():
+    span = Span(name="filtered", interested={EventType.ERROR})
+    added = span.add_events(
+        [
+            (EventType.LOG, {"message": "dropped"}),
+            (EventType.ERROR, {"message": "kept"}),
+        ]
+    )
+    assert len(added) == 1
+    assert span.events[0].event_type == EventType.ERROR
+
+
 def test_span_duration():
     span = Span(name="test", start_time=100.0)
     assert span.duration is None
@@ -53,6 +80,62 @@ def test_trace_save_load(tmp_path: Path):
     assert len(loaded.spans[0].events) == 2
 
 
+def test_trace_load_parallel(tmp_path: Path, monkeypatch):
+    import agent_replay.trace as trace_mod
+
+    trace = Trace(name="parallel-trace")
+    for i in range(8):
+        span = trace.add_span(f"step-{i}")
+        span.add_event(EventType.LOG, {"message": f"msg {i}"})
+    trace.close()
+
+    path = tmp_path / "trace.jsonl"
+    trace.save(path)
+
+    monkeypatch.setattr(trace_mod, "_PARALLEL_LOAD_MIN_LINES", 2)
+    loaded = Trace.load_parallel(path, workers=2)
+    assert loaded.trace_id == trace.trace_id
+    assert len(loaded.spans) == 8
+    assert loaded.event_count == 8
+
+
+def test_trace_msgpack_roundtrip(tmp_path: Path):
+    import pytest
+
+    pytest.importorskip("msgpack")
+
+    trace = Trace(name="binary-trace")
+    span = trace.add_span("step-1")
+    span.add_event(EventType.TOOL_CALL, {"tool": "search", "args": {"q": "test"}})
+    trace.close()
+
+    path = tmp_path / "trace.msgpack"
+    trace.save_msgpack(path)
+
+    loaded = Trace.load_msgpack(path)
+    assert loaded.trace_id == trace.trace_id
+    assert loaded.spans[0].events[0].event_type == EventType.TOOL_CALL
+    assert loaded.spans[0].events[0].data["args"] == {"q": "test"}
+
+
+def test_trace_iter_spans_and_load_header(tmp_path: Path):
+    trace = Trace(name="streamed")
+    for i in range(3):
+        span = trace.add_span(f"step-{i}")
+        span.add_event(EventType.LOG, {"message": f"msg {i}"})
+    trace.close()
+
+    path = tmp_path / "trace.jsonl"
+    trace.save(path)
+
+    names = [span.name for span in Trace.iter_spans(path)]
+    assert names == ["step-0", "step-1", "step-2"]
+
+    header = Trace.load_header(path)
+    assert header["trace_id"] == trace.trace_id
+    assert header["name"] == "streamed"
+
+
 def test_trace_all_events():
     trace = Trace(name="multi")
     s1 = trace.add_span("a")